@@ -475,9 +475,12 @@ class _DataBaseMetaClass(type):
                         setattr(self, field_name, None)
 
             # Add type information for all fields. Do this during init to
-            # allow for forward refs to be imported
-            for field in cls.fields:
-                cls._fields_to_type[field] = cls._get_type_for_field(field)
+            # allow for forward refs to be imported. Resolving the type hints
+            # is expensive, so this is only done the first time.
+            if len(cls._fields_to_type) < len(cls.fields):
+                for field in cls.fields:
+                    if field not in cls._fields_to_type:
+                        cls._fields_to_type[field] = cls._get_type_for_field(field)
 
         # Set docstring to the method explicitly
         __init__.___doc__ = docstring
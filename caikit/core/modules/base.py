@@ -122,6 +122,7 @@ class ModuleBase(metaclass=_ModuleBaseMeta):
         """Returns the inference method signature that is capable of running the module's task
         for the given flavors of input and output streaming
         """
+        cls._validate_tasks()
 
         if task is not None and task in cls._TASK_INFERENCE_SIGNATURES:
             signatures = cls._TASK_INFERENCE_SIGNATURES[task]
@@ -142,8 +143,16 @@ class ModuleBase(metaclass=_ModuleBaseMeta):
         """Returns inference method signatures for all supported flavors
         of input and output streaming for a given task
         """
+        cls._validate_tasks()
         return cls._TASK_INFERENCE_SIGNATURES.get(task)
 
+    @staticmethod
+    def _validate_tasks():
+        """Validates the module against its tasks and populates its inference
+        signatures. This is replaced by the @module decorator and is only run
+        eagerly at decoration time if lazy_task_validation is not enabled.
+        """
+
     @property
     def load_backend(self):
         """Get the backend instance used to load this module. This can be used
@@ -19,6 +19,7 @@ caikit.module
 # Standard
 from typing import Dict, List, Optional, Type, Union
 import collections
+import functools
 
 # Third Party
 import semver
@@ -33,6 +34,7 @@ from ..registries import module_backend_registry, module_backend_types, module_r
 from ..signature_parsing import CaikitMethodSignature
 from ..task import TaskBase
 from .base import ModuleBase
+from caikit.config import get_config
 import caikit.core
 
 log = alog.use_channel("MODULE_DEC")
@@ -193,33 +195,53 @@ def module(
         cls_.TRAIN_SIGNATURE = CaikitMethodSignature(cls_, "train")
         cls_._TASK_INFERENCE_SIGNATURES = {}
 
-        # If the module has tasks, validate them:
+        # If the module has tasks, validate them. This populates the module's
+        # inference signatures, so when validation is lazy it is run the first
+        # time those signatures are looked up.
         task_classes = tasks
-        for t in task_classes:
-            if not t.has_inference_method_decorators(module_class=cls_):
-                # Hackity hack hack - make sure at least one flavor is supported
-                validated = False
-                validation_errs = []
-                for input_streaming, output_streaming in [
-                    [False, False],
-                    [True, True],
-                    [False, True],
-                ]:
-                    try:
-                        t.validate_run_signature(
-                            cls_.RUN_SIGNATURE, input_streaming, output_streaming
-                        )
-                        validated = True
-                        cls_._TASK_INFERENCE_SIGNATURES.setdefault(t, []).append(
-                            (input_streaming, output_streaming, cls_.RUN_SIGNATURE)
-                        )
-                        break
-                    except (ValueError, TypeError) as e:
-                        validation_errs.append(e)
-                if not validated:
-                    raise validation_errs[0]
-
-            t.deferred_method_decoration(cls_)
+        tasks_to_validate = list(task_classes)
+
+        # NOTE: The signatures are only set on the module once every task has
+        #   validated. That way a failed validation that is retried, or two
+        #   threads racing to run a lazy validation, can't leave duplicate or
+        #   partial entries behind.
+        def validate_tasks():
+            inference_signatures = {}
+            for t in tasks_to_validate:
+                if not t.has_inference_method_decorators(module_class=cls_):
+                    # Hackity hack hack - make sure at least one flavor is supported
+                    validated = False
+                    validation_errs = []
+                    for input_streaming, output_streaming in [
+                        [False, False],
+                        [True, True],
+                        [False, True],
+                    ]:
+                        try:
+                            t.validate_run_signature(
+                                cls_.RUN_SIGNATURE, input_streaming, output_streaming
+                            )
+                            validated = True
+                            inference_signatures.setdefault(t, []).append(
+                                (input_streaming, output_streaming, cls_.RUN_SIGNATURE)
+                            )
+                            break
+                        except (ValueError, TypeError) as e:
+                            validation_errs.append(e)
+                    if not validated:
+                        raise validation_errs[0]
+
+                t.deferred_method_decoration(cls_, inference_signatures)
+
+            cls_._TASK_INFERENCE_SIGNATURES = inference_signatures
+
+        # NOTE: A failed validation is not cached, so it will raise again on
+        #   the next lookup
+        cls_._validate_tasks = staticmethod(
+            functools.lru_cache(maxsize=None)(validate_tasks)
+        )
+        if not get_config().lazy_task_validation:
+            cls_._validate_tasks()
 
         # Check to see if a super-class has any tasks.
         # These will have been validated by the superclass decorator already.
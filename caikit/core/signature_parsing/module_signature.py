@@ -65,7 +65,7 @@ class CaikitMethodSignature:
         try:
             self._method_pointer = getattr(self._module, self._method_name)
             self._default_map = parsers.get_args_with_defaults(self._method_pointer)
-            self._method_signature = inspect.signature(self._method_pointer)
+            self._method_signature = parsers.get_method_signature(self._method_pointer)
             self._return_type = parsers.get_output_type_name(
                 self._module, self._method_signature, self._method_pointer
             )
@@ -16,6 +16,7 @@ Contains functions that attempt to parse the I/O types of member methods on `cai
 """
 # Standard
 from typing import Any, Callable, Dict, List, Optional, Type
+import functools
 import inspect
 
 # First Party
@@ -34,6 +35,30 @@ KNOWN_ARG_TYPES = {
 }
 
 
+def get_method_signature(module_method: Callable) -> inspect.Signature:
+    """Get the inspect.Signature for a method. This is memoized on the method
+    itself since decorating a module inspects the same `run` and `train`
+    methods several times over.
+
+    Args:
+        module_method (Callable): A pointer to a method
+
+    Returns:
+        inspect.Signature: The signature of the method
+    """
+    try:
+        hash(module_method)
+    except TypeError:
+        # Unhashable callables can't be cached
+        return inspect.signature(module_method)
+    return _get_method_signature_cached(module_method)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_method_signature_cached(module_method: Callable) -> inspect.Signature:
+    return inspect.signature(module_method)
+
+
 @alog.logged_function(log.debug2)
 def get_output_type_name(
     module_class: ModuleBase.__class__,
@@ -92,7 +117,7 @@ def get_argument_types(module_method: Callable) -> Dict[str, Type]:
     Returns:
         Dict[str, Type]: A dictionary of parameter name to parameter type
     """
-    method_signature = inspect.signature(module_method)
+    method_signature = get_method_signature(module_method)
     return {
         name: _get_argument_type(param, module_method)
         for name, param in method_signature.parameters.items()
@@ -111,7 +136,7 @@ def get_args_with_defaults(module_method: Callable) -> Dict[str, Any]:
         Dict[str: Any]: A set of all parameter names which have a default value.
             Empty if none have defaults or no parameters exist.
     """
-    method_signature = inspect.signature(module_method)
+    method_signature = get_method_signature(module_method)
     return {
         param.name: param.default
         for param in method_signature.parameters.values()
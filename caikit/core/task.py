@@ -13,9 +13,21 @@
 # limitations under the License.
 # Standard
 from inspect import isclass
-from typing import Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 import collections
 import dataclasses
+import types
 import typing
 
 # First Party
@@ -42,6 +54,20 @@ _STREAM_PARAMS_ANNOTATION = "__streaming_params"
 _UNARY_OUT_ANNOTATION = "__unary_output_type"
 _UNARY_PARAMS_ANNOTATION = "__unary_params"
 
+# The origins of the common Iterable[T] annotations. Checking membership here
+# is much cheaper than the issubclass check against collections.abc.Iterable.
+_ITERABLE_ORIGINS = frozenset(
+    {
+        list,
+        tuple,
+        set,
+        frozenset,
+        collections.abc.Iterable,
+        collections.abc.Iterator,
+        DataStream,
+    }
+)
+
 
 class TaskBase:
     """The TaskBase defines the interface for an abstract AI task
@@ -58,6 +84,15 @@ class TaskBase:
         i.e. the args to a `@TaskClass.taskmethod` decoration.
         """
 
+        # One of these is held for every decorated inference method, so avoid
+        # giving each one a __dict__
+        __slots__ = (
+            "method_name",
+            "input_streaming",
+            "output_streaming",
+            "context_arg",
+        )
+
         method_name: str  # the simple name of a method, like "run"
         input_streaming: bool
         output_streaming: bool
@@ -69,6 +104,16 @@ class TaskBase:
         Type["TaskBase"], Dict[str, List["TaskBase.InferenceMethodPtr"]]
     ] = {}
 
+    # The element types of the streaming parameters and streaming output. These
+    # are resolved once by the @task decorator so that validating each module's
+    # signature doesn't need to unpack the Iterable[T] annotations again.
+    _streaming_param_element_types: Dict[str, Type] = {}
+    _streaming_output_element_type: Optional[Type] = None
+
+    # The args of any Union parameter types, keyed by input streaming flavor and
+    # then parameter name. Also resolved once by the @task decorator.
+    _union_param_args: Dict[bool, Dict[str, FrozenSet[Type]]] = {False: {}, True: {}}
+
     @classmethod
     def taskmethod(
         cls,
@@ -106,13 +151,20 @@ class TaskBase:
         return decorator
 
     @classmethod
-    def deferred_method_decoration(cls, module: Type):
+    def deferred_method_decoration(
+        cls,
+        module: Type,
+        inference_signatures: Optional[Dict[Type["TaskBase"], List]] = None,
+    ):
         """Runs the actual decoration logic that `taskmethod` would have run if the module class
         existed during its lifetime.
 
         Validates that all decorated methods match the task's API expectations, and stores the
-        signatures on the module class for access later.
+        signatures on the module class for access later. If inference_signatures is given, the
+        signatures are stored there instead.
         """
+        if inference_signatures is None:
+            inference_signatures = module._TASK_INFERENCE_SIGNATURES
         if cls.has_inference_method_decorators(module):
             keyname = _make_keyname_for_module(module)
             deferred_decorations = cls.deferred_method_decorators[cls][keyname]
@@ -124,7 +176,7 @@ class TaskBase:
                     signature, decoration.input_streaming, decoration.output_streaming
                 )
 
-                module._TASK_INFERENCE_SIGNATURES.setdefault(cls, []).append(
+                inference_signatures.setdefault(cls, []).append(
                     (decoration.input_streaming, decoration.output_streaming, signature)
                 )
 
@@ -161,9 +213,10 @@ class TaskBase:
                 "Task could not be validated, no .run return type was provided"
             )
 
+        required_parameters = cls.get_required_parameters(input_streaming)
         missing_required_params = [
             parameter_name
-            for parameter_name in cls.get_required_parameters(input_streaming)
+            for parameter_name in required_parameters
             if parameter_name not in signature.parameters
         ]
         if missing_required_params:
@@ -172,26 +225,25 @@ class TaskBase:
                 f"{signature.module}"
             )
 
+        union_param_args = cls._union_param_args[input_streaming]
         type_mismatch_errors = []
-        for parameter_name, parameter_type in cls.get_required_parameters(
-            input_streaming
-        ).items():
+        for parameter_name, parameter_type in required_parameters.items():
             signature_type = signature.parameters[parameter_name]
             if parameter_type != signature_type:
-                if typing.get_origin(signature_type) == typing.Union and (
+                if typing.get_origin(signature_type) == typing.Union:
+                    signature_args = typing.get_args(signature_type)
                     # Either our parameter type is not a union & is part of the union signature
-                    parameter_type in typing.get_args(signature_type)
+                    if parameter_type in signature_args:
+                        continue
                     # Or our parameter type is a union that's a subset of the union signature
-                    or (
-                        typing.get_origin(parameter_type) == typing.Union
-                        and set(typing.get_args(parameter_type)).issubset(
-                            set(typing.get_args(signature_type))
-                        )
-                    )
-                ):
-                    continue
-                if input_streaming and cls._is_iterable_type(parameter_type):
-                    streaming_type = typing.get_args(parameter_type)[0]
+                    parameter_args = union_param_args.get(parameter_name)
+                    if parameter_args is not None and parameter_args.issubset(
+                        signature_args
+                    ):
+                        continue
+                if input_streaming:
+                    # Streaming parameters are all Iterable[T], see @task
+                    streaming_type = cls._streaming_param_element_types[parameter_name]
 
                     for iterable_type in typing.get_args(signature_type):
                         if not cls._subclass_check(iterable_type, streaming_type):
@@ -216,8 +268,11 @@ class TaskBase:
     @classmethod
     def get_required_parameters(
         cls, input_streaming: bool
-    ) -> Dict[str, Union[ValidInputTypes, Type[Iterable[ValidInputTypes]]]]:
-        """Get the set of input types required by this task"""
+    ) -> Mapping[str, Union[ValidInputTypes, Type[Iterable[ValidInputTypes]]]]:
+        """Get the set of input types required by this task
+
+        NOTE: The returned mapping is read-only
+        """
         if not input_streaming:
             if _UNARY_PARAMS_ANNOTATION not in cls.__annotations__:
                 raise ValueError("No unary inputs are specified for this task")
@@ -258,10 +313,10 @@ class TaskBase:
         # Do some streaming checks
         if output_streaming and cls._is_iterable_type(output_type):
             # task_output_type is already guaranteed to be Iterable[T]
-            streaming_type = typing.get_args(task_output_type)[0]
-
             for iterable_type in typing.get_args(output_type):
-                if cls._subclass_check(iterable_type, streaming_type):
+                if cls._subclass_check(
+                    iterable_type, cls._streaming_output_element_type
+                ):
                     return
 
         raise TypeError(
@@ -289,6 +344,8 @@ class TaskBase:
         This is implemented this way to support older python versions where
         isinstance(typ, typing.Iterable) does not work
         """
+        if typing.get_origin(typ) in _ITERABLE_ORIGINS:
+            return True
         try:
             iter(typ)
             return True
@@ -382,15 +439,19 @@ def task(
         if streaming_output_type:
             cls_annotations[_STREAM_OUT_ANNOTATION] = streaming_output_type
 
-        # Backwards compatibility with old-style @tasks
-        if "required_parameters" in kwargs and not unary_parameters:
-            cls_annotations[_UNARY_PARAMS_ANNOTATION] = kwargs["required_parameters"]
-        if "output_type" in kwargs and not unary_output_type:
-            output_type = kwargs["output_type"]
-            if cls._is_iterable_type(output_type):
-                cls_annotations[_STREAM_OUT_ANNOTATION] = kwargs["output_type"]
-            else:
-                cls_annotations[_UNARY_OUT_ANNOTATION] = kwargs["output_type"]
+        # Backwards compatibility with old-style @tasks. These are only
+        # checked for when extra kwargs were given at all.
+        if kwargs:
+            if "required_parameters" in kwargs and not unary_parameters:
+                cls_annotations[_UNARY_PARAMS_ANNOTATION] = kwargs[
+                    "required_parameters"
+                ]
+            if "output_type" in kwargs and not unary_output_type:
+                output_type = kwargs["output_type"]
+                if cls._is_iterable_type(output_type):
+                    cls_annotations[_STREAM_OUT_ANNOTATION] = output_type
+                else:
+                    cls_annotations[_UNARY_OUT_ANNOTATION] = output_type
         # End Backwards compatibility
 
         error.value_check(
@@ -417,10 +478,9 @@ def task(
                     f"subclass check failed: {cls.get_output_type(output_streaming=True)} is \
                         not a subclass of (<class 'collections.abc.Iterable'>"
                 )
-            error.subclass_check(
+            _check_iterable_origin(
                 "<COR12766440E>",
                 typing.get_origin(cls.get_output_type(output_streaming=True)),
-                collections.abc.Iterable,
             )
 
         if _UNARY_PARAMS_ANNOTATION in cls_annotations:
@@ -430,6 +490,9 @@ def task(
                 "<COR00123440E>", str, params_dict_keys=params_dict.keys()
             )
             # TODO: check proto-ability of things
+            cls_annotations[_UNARY_PARAMS_ANNOTATION] = types.MappingProxyType(
+                dict(params_dict)
+            )
         if _STREAM_PARAMS_ANNOTATION in cls_annotations:
             params_dict = cls.get_required_parameters(input_streaming=True)
             error.type_check("<COR19556230E>", dict, params_dict=params_dict)
@@ -437,9 +500,41 @@ def task(
                 "<COR58796465E>", str, params_dict_keys=params_dict.keys()
             )
             for v in params_dict.values():
-                error.subclass_check(
-                    "<COR52740295E>", typing.get_origin(v), collections.abc.Iterable
-                )
+                _check_iterable_origin("<COR52740295E>", typing.get_origin(v))
+            cls_annotations[_STREAM_PARAMS_ANNOTATION] = types.MappingProxyType(
+                dict(params_dict)
+            )
+
+        # NOTE: The parameter mappings are copied and frozen above so that they
+        #   can't change out from under modules that were validated against
+        #   them. This makes the task class itself a sufficient cache key for
+        #   anything derived from its parameters.
+
+        # Resolve the element types of the Iterable[T] streaming annotations
+        cls._streaming_param_element_types = {
+            param_name: _get_element_type(param_type)
+            for param_name, param_type in cls_annotations.get(
+                _STREAM_PARAMS_ANNOTATION, {}
+            ).items()
+        }
+        cls._streaming_output_element_type = _get_element_type(
+            cls_annotations.get(_STREAM_OUT_ANNOTATION)
+        )
+
+        # Resolve the args of any Union parameter types
+        cls._union_param_args = {
+            input_streaming: {
+                param_name: frozenset(typing.get_args(param_type))
+                for param_name, param_type in cls_annotations.get(
+                    params_annotation, {}
+                ).items()
+                if typing.get_origin(param_type) == Union
+            }
+            for input_streaming, params_annotation in [
+                (False, _UNARY_PARAMS_ANNOTATION),
+                (True, _STREAM_PARAMS_ANNOTATION),
+            ]
+        }
 
         return cls
 
@@ -448,3 +543,15 @@ def task(
 
 def _make_keyname_for_module(module_class: Type) -> str:
     return ".".join([module_class.__module__, module_class.__qualname__])
+
+
+def _check_iterable_origin(log_code: str, origin: Optional[Type]):
+    """Raise a TypeError unless origin is a subclass of collections.abc.Iterable"""
+    if origin not in _ITERABLE_ORIGINS:
+        error.subclass_check(log_code, origin, collections.abc.Iterable)
+
+
+def _get_element_type(iterable_type: Optional[Type]) -> Optional[Type]:
+    """Get T from an Iterable[T] annotation, or None if there isn't one"""
+    type_args = typing.get_args(iterable_type)
+    return type_args[0] if type_args else None
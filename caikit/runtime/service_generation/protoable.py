@@ -16,7 +16,8 @@ This file contains our logic about what constitutes a proto-able for RPC generat
 """
 
 # Standard
-from typing import Dict, List, Type, Union, get_args, get_origin
+from typing import Dict, List, Tuple, Type, Union, get_args, get_origin
+import functools
 import typing
 
 # First Party
@@ -31,6 +32,10 @@ import caikit
 
 log = alog.use_channel("PROTOABLES")
 
+# Types that can never be data model types. Checking membership here is much
+# cheaper than the issubclass check in is_data_model_type.
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, bytes, complex, type(None)})
+
 
 def to_protoable_signature(signature: Dict[str, Type]) -> Dict[str, Type]:
     """Returns dictionary of protoable types only
@@ -129,11 +134,27 @@ def get_union_list_type(field_name: str, union_protoables: List) -> Type[DataBas
 
 
 def get_protoable_return_type(arg_type: Type) -> Type:
-    """Helper function that determines the right data model type to use from a Union"""
+    """Helper function that determines the right data model type to use from a Union
 
-    # Decompose this type using typing to determine if it's a useful typing hint
-    typing_origin = get_origin(arg_type)
+    NOTE: Results are cached per annotation, so the warning for a non-DM return
+        type is only logged the first time that annotation is seen. Use
+        get_protoable_return_type.cache_clear() to reset the cache.
+    """
+    # NOTE: Unions compare equal regardless of the order of their args, but the
+    #   first data model type in a Union wins, so the ordered args are part of
+    #   the cache key
     typing_args = get_args(arg_type)
+    try:
+        hash((arg_type, typing_args))
+    except TypeError:
+        # Annotations with unhashable metadata can't be cached
+        return _get_protoable_return_type(arg_type, typing_args)
+    return _get_protoable_return_type_cached(arg_type, typing_args)
+
+
+def _get_protoable_return_type(arg_type: Type, typing_args: Tuple) -> Type:
+    """Implementation of get_protoable_return_type"""
+    typing_origin = get_origin(arg_type)
 
     # If this is a data model type, no need to do anything
     if is_data_model_type(arg_type):
@@ -141,7 +162,11 @@ def get_protoable_return_type(arg_type: Type) -> Type:
 
     # Handle Unions by looking for a data model object in the union
     if typing_origin is Union:
-        dm_types = [arg for arg in typing_args if is_data_model_type(arg)]
+        dm_types = [
+            arg
+            for arg in typing_args
+            if arg not in _PRIMITIVE_TYPES and is_data_model_type(arg)
+        ]
         if dm_types:
             log.debug2(
                 "Found data model types in Union: [%s], taking first one", dm_types
@@ -163,6 +188,14 @@ def get_protoable_return_type(arg_type: Type) -> Type:
     return arg_type
 
 
+# The same return type annotations are seen over and over again when generating
+# services, so the result for each one is only computed once
+_get_protoable_return_type_cached = functools.lru_cache(maxsize=None)(
+    _get_protoable_return_type
+)
+get_protoable_return_type.cache_clear = _get_protoable_return_type_cached.cache_clear
+
+
 def is_protoable_type(arg_type: Type) -> bool:
     """
     Returns True if arg_type is in PROTO_TYPE_MAP(float, int, bool, str, bytes)
@@ -171,9 +204,8 @@ def is_protoable_type(arg_type: Type) -> bool:
     Or if it's a List of one of those.
     Or if it's a Dict of one of those.
     False otherwise"""
-    proto_primitive_set = list(DATAOBJECT_PY_TO_PROTO_TYPES.keys())
     protoable = False
-    if arg_type in proto_primitive_set:
+    if _is_proto_primitive(arg_type):
         protoable = True
     elif is_data_model_type(arg_type):
         protoable = True
@@ -190,10 +222,8 @@ def is_protoable_type(arg_type: Type) -> bool:
             log.debug2("Dict annotation has no type")
             protoable = False
         else:
-            protoable = (
-                typing.get_args(arg_type)[0] in proto_primitive_set
-                and typing.get_args(arg_type)[1] in proto_primitive_set
-            )
+            key_type, val_type = typing.get_args(arg_type)
+            protoable = _is_proto_primitive(key_type) and _is_proto_primitive(val_type)
     elif typing.get_origin(arg_type) == Union:
         log.debug2("Arg is Union")
         # pylint: disable=use-a-generator
@@ -202,3 +232,14 @@ def is_protoable_type(arg_type: Type) -> bool:
     if not protoable:
         log.debug2("Arg is not protoable, arg_type: %s", arg_type)
     return protoable
+
+
+def _is_proto_primitive(arg_type: Type) -> bool:
+    """Returns True if arg_type maps directly to a protobuf type. This is a
+    hashed lookup in DATAOBJECT_PY_TO_PROTO_TYPES rather than a scan of its keys.
+    """
+    try:
+        return arg_type in DATAOBJECT_PY_TO_PROTO_TYPES
+    except TypeError:
+        # Annotations with unhashable metadata can't be primitives
+        return False
@@ -15,6 +15,7 @@
 """Tests for the functionality in the base class for data model objects"""
 
 # Standard
+from unittest.mock import patch
 import importlib
 import os
 
@@ -496,6 +497,33 @@ def test_get_field_message_type_invalid_field():
             msg.get_field_message_type("bar")
 
 
+def test_field_types_resolved_once():
+    """Make sure that the field type hints are only resolved for the first
+    instance of a data model class
+    """
+    with temp_data_model(
+        make_proto_def(
+            {
+                "ThingOne": {
+                    "foo": int,
+                    "bar": str,
+                },
+            },
+            mock_compiled=True,
+        )
+    ) as dm:
+        dm.ThingOne(1, "one")
+        assert set(dm.ThingOne._fields_to_type) == {"foo", "bar"}
+        with patch.object(
+            dm.ThingOne,
+            "_get_type_for_field",
+            side_effect=AssertionError("resolved again"),
+        ):
+            inst = dm.ThingOne(2, "two")
+        assert inst.foo == 2
+        assert inst.bar == "two"
+
+
 #############################
 ## Serialization Edge Cases ##
 #############################
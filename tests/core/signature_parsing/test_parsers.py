@@ -29,6 +29,7 @@ from caikit.core.signature_parsing.parsers import (
     _snake_to_camel,
     get_args_with_defaults,
     get_argument_types,
+    get_method_signature,
     get_output_type_name,
 )
 import caikit.core
@@ -279,3 +280,33 @@ def test_get_args_with_known_args():
         get_argument_types(_run)["producer_id"]
         == caikit.core.data_model.producer.ProducerId
     )
+
+
+def test_get_method_signature_is_cached():
+    """Check that the signature of a method is only inspected once"""
+
+    def _run(a: int, b: str = "foo") -> str:
+        pass
+
+    with patch.object(inspect, "signature", wraps=inspect.signature) as mock_sig:
+        sig = get_method_signature(_run)
+        assert get_method_signature(_run) is sig
+        assert get_argument_types(_run) == {"a": int, "b": str}
+        assert get_args_with_defaults(_run) == {"b": "foo"}
+        mock_sig.assert_called_once_with(_run)
+
+
+def test_get_method_signature_unhashable_callable():
+    """Make sure that callables that can't be hashed are still handled"""
+
+    class UnhashableCallable:
+        def __eq__(self, other):
+            return self is other
+
+        def __call__(self, a: int, b: str = "foo") -> str:
+            pass
+
+    run_fn = UnhashableCallable()
+    assert list(get_method_signature(run_fn).parameters) == ["a", "b"]
+    assert get_argument_types(run_fn) == {"a": int, "b": str}
+    assert get_args_with_defaults(run_fn) == {"b": "foo"}
@@ -1,6 +1,6 @@
 ## Tests #######################################################################
 # Standard
-from typing import Iterable, Union
+from typing import Iterable, Iterator, List, Union
 import uuid
 
 # Third Party
@@ -22,6 +22,7 @@ from sample_lib.modules.multi_task import (
     MultiTaskModule,
     SecondTask,
 )
+from tests.conftest import temp_config
 import caikit.core
 
 
@@ -43,6 +44,60 @@ def test_task_decorator_has_streaming_types():
     }
 
 
+def test_task_validates_streaming_element_types():
+    @task(
+        unary_parameters={"text": str},
+        streaming_parameters={"tokens": Iterable[SampleInputType]},
+        streaming_output_type=Iterable[SampleOutputType],
+    )
+    class SampleTask(TaskBase):
+        pass
+
+    @caikit.core.module(
+        id=str(uuid.uuid4()), name="Stuff", version="0.0.1", task=SampleTask
+    )
+    class Stuff(caikit.core.ModuleBase):
+        @SampleTask.taskmethod(input_streaming=True, output_streaming=True)
+        def run_bidi(
+            self, tokens: caikit.core.data_model.DataStream[SampleInputType]
+        ) -> caikit.core.data_model.DataStream[SampleOutputType]:
+            pass
+
+    assert Stuff.get_inference_signature(True, True) is not None
+
+    with pytest.raises(TypeError, match="Wrong input type for tokens"):
+
+        @caikit.core.module(
+            id=str(uuid.uuid4()), name="Things", version="0.0.1", task=SampleTask
+        )
+        class Things(caikit.core.ModuleBase):
+            @SampleTask.taskmethod(input_streaming=True, output_streaming=True)
+            def run_bidi(
+                self, tokens: caikit.core.data_model.DataStream[SampleOutputType]
+            ) -> caikit.core.data_model.DataStream[SampleOutputType]:
+                pass
+
+
+def test_task_decorator_freezes_parameters():
+    unary_parameters = {"text": str}
+
+    @task(
+        unary_parameters=unary_parameters,
+        streaming_parameters={"tokens": Iterable[str]},
+        unary_output_type=SampleOutputType,
+    )
+    class SampleTask(TaskBase):
+        pass
+
+    # Changes to the original dict don't leak into the task
+    unary_parameters["other"] = int
+    assert SampleTask.get_required_parameters(input_streaming=False) == {"text": str}
+
+    for input_streaming in [True, False]:
+        with pytest.raises(TypeError):
+            SampleTask.get_required_parameters(input_streaming)["foo"] = str
+
+
 def test_task_decorator_validates_class_extends_task_base():
     with pytest.raises(TypeError, match="is not a subclass of .*TaskBase"):
 
@@ -102,6 +157,36 @@ def test_task_decorator_validates_streaming_input_is_iterable():
             pass
 
 
+def test_task_decorator_accepts_common_iterable_types():
+    @task(
+        streaming_parameters={
+            "tokens": List[str],
+            "stream": caikit.core.data_model.DataStream[str],
+            "iterator": Iterator[str],
+        },
+        streaming_output_type=Iterable[SampleOutputType],
+    )
+    class StreamingTask(TaskBase):
+        pass
+
+    @caikit.core.module(
+        id=str(uuid.uuid4()), name="Stuff", version="0.0.1", task=StreamingTask
+    )
+    class Stuff(caikit.core.ModuleBase):
+        @StreamingTask.taskmethod(input_streaming=True, output_streaming=True)
+        def run_bidi(
+            self,
+            tokens: caikit.core.data_model.DataStream[str],
+            stream: caikit.core.data_model.DataStream[str],
+            iterator: caikit.core.data_model.DataStream[str],
+        ) -> caikit.core.data_model.DataStream[SampleOutputType]:
+            pass
+
+    assert Stuff.get_inference_signature(True, True) is not None
+    assert TaskBase._is_iterable_type(List[str])
+    assert not TaskBase._is_iterable_type(str)
+
+
 def test_task_validator_raises_on_wrong_streaming_type():
     @task(
         unary_parameters={"sample_input": SampleInputType},
@@ -275,6 +360,67 @@ def test_task_validation_throws_on_wrong_return_type():
                 pass
 
 
+def test_task_validation_is_deferred_when_lazy():
+    @task(
+        unary_parameters={"foo": int},
+        unary_output_type=SampleOutputType,
+    )
+    class SomeTask(TaskBase):
+        pass
+
+    @task(
+        unary_parameters={"bar": str},
+        unary_output_type=SampleOutputType,
+    )
+    class OtherTask(TaskBase):
+        pass
+
+    with temp_config({"lazy_task_validation": True}, "merge"):
+
+        @caikit.core.module(
+            id=str(uuid.uuid4()), name="Stuff", version="0.0.1", task=SomeTask
+        )
+        class Stuff(caikit.core.ModuleBase):
+            def run(self, foo: int) -> SampleInputType:
+                pass
+
+        @caikit.core.module(
+            id=str(uuid.uuid4()), name="Things", version="0.0.1", task=SomeTask
+        )
+        class Things(caikit.core.ModuleBase):
+            def run(self, foo: int) -> SampleOutputType:
+                pass
+
+        @caikit.core.module(
+            id=str(uuid.uuid4()),
+            name="Partial",
+            version="0.0.1",
+            tasks=[SomeTask, OtherTask],
+        )
+        class Partial(caikit.core.ModuleBase):
+            def run(self, foo: int) -> SampleOutputType:
+                pass
+
+    # Validation errors are raised whenever the signatures are looked up
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Wrong output type for module"):
+            Stuff.get_inference_signatures(SomeTask)
+
+    # A partially successful validation doesn't leave any signatures behind
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            Partial.get_inference_signatures(SomeTask)
+        assert Partial._TASK_INFERENCE_SIGNATURES == {}
+
+    signatures = Things.get_inference_signatures(SomeTask)
+    assert len(signatures) == 1
+    assert Things.get_inference_signature(False, False) is signatures[0][2]
+
+    # Re-running the validation doesn't duplicate the signatures
+    Things._validate_tasks.cache_clear()
+    assert Things.get_inference_signatures(SomeTask) == signatures
+
+
 def test_task_validation_accepts_union_outputs():
     @task(
         unary_parameters={"foo": int},
@@ -622,6 +768,50 @@ def test_validation_does_not_allow_union_supersets():
                 pass
 
 
+def test_validation_union_subsets_only_apply_to_unary_inputs():
+    """Ensure that a union parameter for unary inputs isn't used to validate a
+    streaming input parameter with the same name
+    """
+
+    @task(
+        unary_parameters={"sample_input": Union[str, int]},
+        streaming_parameters={"sample_input": Iterable[str]},
+        unary_output_type=SampleOutputType,
+    )
+    class SomeTask(TaskBase):
+        pass
+
+    @caikit.core.module(
+        id=str(uuid.uuid4()),
+        name="SomeModule",
+        version="0.0.1",
+        task=SomeTask,
+    )
+    class SomeModule(caikit.core.ModuleBase):
+        @SomeTask.taskmethod()
+        def run(self, sample_input: Union[str, int, bytes]) -> SampleOutputType:
+            pass
+
+        @SomeTask.taskmethod(input_streaming=True)
+        def run_stream_in(
+            self, sample_input: caikit.core.data_model.DataStream[str]
+        ) -> SampleOutputType:
+            pass
+
+    with pytest.raises(TypeError, match="Wrong input type for sample_input"):
+
+        @caikit.core.module(
+            id=str(uuid.uuid4()),
+            name="OtherModule",
+            version="0.0.1",
+            task=SomeTask,
+        )
+        class OtherModule(caikit.core.ModuleBase):
+            @SomeTask.taskmethod(input_streaming=True)
+            def run_stream_in(self, sample_input: Union[str, int]) -> SampleOutputType:
+                pass
+
+
 def test_tasks_property_order():
     """Ensure that the tasks returned by .tasks have a deterministic order that
     respects the order given in the module decorator
@@ -685,3 +875,58 @@ def test_task_backwards_compatibility():
         class SomeModule(caikit.core.ModuleBase):
             def run(self, foo: int) -> SampleInputType:
                 pass
+
+
+def test_task_backwards_compatibility_streaming_output_type():
+    """An iterable old-style 'output_type' is treated as the streaming output"""
+
+    @task(
+        unary_parameters={"foo": int},
+        output_type=Iterable[SampleOutputType],
+    )
+    class SomeTask(TaskBase):
+        pass
+
+    assert SomeTask.get_output_type(output_streaming=True) == Iterable[SampleOutputType]
+    with pytest.raises(ValueError, match="No unary outputs"):
+        SomeTask.get_output_type(output_streaming=False)
+
+    @caikit.core.module(
+        id=str(uuid.uuid4()), name="Stuff", version="0.0.1", task=SomeTask
+    )
+    class SomeModule(caikit.core.ModuleBase):
+        @SomeTask.taskmethod(output_streaming=True)
+        def run_stream_out(
+            self, foo: int
+        ) -> caikit.core.data_model.DataStream[SampleOutputType]:
+            pass
+
+    assert SomeModule.get_inference_signature(False, True) is not None
+
+
+def test_task_backwards_compatibility_empty_required_parameters():
+    """An empty old-style 'required_parameters' still defines the unary flavor"""
+
+    @task(
+        required_parameters={},
+        streaming_parameters={"foo": Iterable[int]},
+        output_type=SampleOutputType,
+    )
+    class SomeTask(TaskBase):
+        pass
+
+    assert SomeTask.get_required_parameters(input_streaming=False) == {}
+    assert SomeTask.get_required_parameters(input_streaming=True) == {
+        "foo": Iterable[int]
+    }
+
+
+def test_inference_method_ptr_has_no_dict():
+    ptr = TaskBase.InferenceMethodPtr(
+        method_name="run",
+        input_streaming=False,
+        output_streaming=True,
+        context_arg=None,
+    )
+    assert not hasattr(ptr, "__dict__")
+    assert ptr == TaskBase.InferenceMethodPtr("run", False, True, None)
@@ -1,5 +1,6 @@
 # Standard
 from typing import Dict, List, Optional, Union
+from unittest.mock import patch
 import json
 
 # Third Party
@@ -10,6 +11,7 @@ from py_to_proto.dataclass_to_proto import Annotated
 
 # Local
 from caikit.core.data_model.base import DataBase
+from caikit.runtime.service_generation import protoable
 from caikit.runtime.service_generation.protoable import (
     get_protoable_return_type,
     to_protoable_signature,
@@ -125,6 +127,16 @@ def test_to_protoable_signature_unsupported_dict():
     )
 
 
+def test_to_protoable_signature_unhashable_annotation():
+    unhashable = Annotated[str, {"not": "hashable"}]
+    assert to_protoable_signature(signature={"name": unhashable}) == {}
+
+
+def test_to_output_dm_type_with_unhashable_annotation():
+    unhashable = Annotated[str, {"not": "hashable"}]
+    assert get_protoable_return_type(unhashable) == unhashable
+
+
 def test_to_protoable_signature_dict_incomplete_type_hint():
     assert (
         to_protoable_signature(
@@ -339,3 +351,34 @@ def test_to_output_dm_type_with_union_optional_dm():
         get_protoable_return_type(Union[Optional[SampleOutputType], str])
         == SampleOutputType
     )
+
+
+def test_to_output_dm_type_respects_union_order():
+    """Unions with the same args compare equal, but the first data model type
+    in the union should always be picked
+    """
+    assert (
+        get_protoable_return_type(Union[SampleOutputType, SampleInputType])
+        == SampleOutputType
+    )
+    assert (
+        get_protoable_return_type(Union[SampleInputType, SampleOutputType])
+        == SampleInputType
+    )
+
+
+def test_to_output_dm_type_with_union_of_primitives():
+    assert get_protoable_return_type(Union[str, int, None]) == Union[str, int, None]
+
+
+def test_to_output_dm_type_cache_clear():
+    """Make sure the cache can be reset without reaching into private names"""
+    assert get_protoable_return_type(SampleOutputType) == SampleOutputType
+    with patch.object(
+        protoable, "is_data_model_type", wraps=protoable.is_data_model_type
+    ) as mock_is_dm:
+        assert get_protoable_return_type(SampleOutputType) == SampleOutputType
+        mock_is_dm.assert_not_called()
+        get_protoable_return_type.cache_clear()
+        assert get_protoable_return_type(SampleOutputType) == SampleOutputType
+        mock_is_dm.assert_called_once_with(SampleOutputType)